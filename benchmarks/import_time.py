@@ -0,0 +1,39 @@
+"""
+Measures how long it takes to import CircuitsAPI in a fresh interpreter.
+
+The core (encoders & helpers) should load in milliseconds. The client pulls in
+aiohttp, recnetpy, recnetlogin and jwt, so it's measured separately.
+
+Usage: python benchmarks/import_time.py [runs]
+Requires CircuitsAPI to be installed, ex. 'pip install -e .'.
+"""
+
+import subprocess
+import statistics
+import sys
+
+TARGETS = {
+    "circuitsapi": "import circuitsapi",
+    "circuitsapi.helpers": "from circuitsapi import run_length_encoding",
+    "circuitsapi.Client": "from circuitsapi import Client",
+}
+
+
+def measure(code: str, runs: int) -> float:
+    """Returns the median wall time of running the code in a fresh interpreter in milliseconds."""
+    timer = f"import time; t = time.perf_counter(); {code}; print((time.perf_counter() - t) * 1000)"
+    times = []
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, "-c", timer], capture_output=True, text=True, check=True)
+        times.append(float(out.stdout))
+    return statistics.median(times)
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    for name, code in TARGETS.items():
+        print(f"{name:<30} {measure(code, runs):8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,44 @@
-from .client import RoomConnection, UserConnection, Client
+from typing import TYPE_CHECKING
 from .exceptions import RoomNotFound, UserNotFound
-from .helpers import run_length_encoding, run_length_decoding
\ No newline at end of file
+from .helpers import run_length_encoding, run_length_decoding
+from .emulator import CircuitEmulator
+
+# Integration modules pull in aiohttp, recnetpy, recnetlogin, jwt and heavier parts of the standard library.
+# They're only imported when used, so the encoders load instantly.
+_lazy_imports = {
+    "Client": ".client",
+    "RoomConnection": ".client",
+    "UserConnection": ".client",
+    "BusConnection": ".client",
+    "TokenProvider": ".auth",
+    "StaticTokenProvider": ".auth",
+    "RecNetLoginProvider": ".auth",
+    "Fleet": ".fleet",
+    "TransmitterPool": ".pool",
+    "Journal": ".journal",
+    "read_journal": ".journal",
+    "replay_journal": ".replay",
+    "Uplink": ".uplink",
+}
+
+if TYPE_CHECKING:
+    from .client import RoomConnection, UserConnection, BusConnection, Client
+    from .auth import TokenProvider, StaticTokenProvider, RecNetLoginProvider
+    from .fleet import Fleet
+    from .pool import TransmitterPool
+    from .journal import Journal, read_journal
+    from .replay import replay_journal
+    from .uplink import Uplink
+
+
+def __getattr__(name: str):
+    if name in _lazy_imports:
+        import importlib
+        value = getattr(importlib.import_module(_lazy_imports[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted([*globals(), *_lazy_imports])
\ No newline at end of file
@@ -0,0 +1,74 @@
+import asyncio
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from recnetlogin import RecNetLogin
+
+
+class TokenProvider(ABC):
+    """Base class for access token providers.
+
+    Subclass this to plug in your own method of fetching the RR access token.
+    The client asks the provider for a new token before the current one expires.
+    """
+
+    #: False if the provider always returns the same token
+    refreshable: bool = True
+
+    @abstractmethod
+    async def get_token(self) -> str:
+        """Returns a valid access token. Must not block the event loop.
+
+        Returns:
+            str: RR access token
+        """
+
+    async def close(self) -> None:
+        """Releases any resources held by the provider.
+        """
+
+
+class StaticTokenProvider(TokenProvider):
+    refreshable = False
+
+    def __init__(self, token: str):
+        """Provides a fixed access token.
+
+        Args:
+            token (str): RR access token
+        """
+        self.token = token
+
+    async def get_token(self) -> str:
+        return self.token
+
+
+class RecNetLoginProvider(TokenProvider):
+    def __init__(self, env_path: str | None = None, rnl: "RecNetLogin | None" = None):
+        """Provides access tokens with RecNetLogin. The login runs in a thread so it doesn't block the event loop.
+
+        Args:
+            env_path (str | None, optional): Path to an .env.secret file with the RecNet cookie. Defaults to None.
+            rnl (RecNetLogin | None, optional): Existing RecNetLogin instance to use instead of logging in. Defaults to None.
+        """
+        self.env_path = env_path
+        self.rnl = rnl
+
+    async def get_token(self) -> str:
+        return await asyncio.to_thread(self.__get_token)
+
+    async def close(self) -> None:
+        if self.rnl:
+            self.rnl.close()
+
+    def __get_token(self) -> str:
+        """Logs in on the first call. RecNetLogin renews the token when it's about to expire.
+
+        Returns:
+            str: RR access token
+        """
+        if not self.rnl:
+            from recnetlogin import RecNetLogin
+            self.rnl = RecNetLogin(self.env_path)
+        return self.rnl.get_token()
@@ -0,0 +1,152 @@
+import json
+import sqlite3
+import time
+from dataclasses import dataclass
+
+
+@dataclass
+class CachedRoom:
+    """Room data read from the metadata cache."""
+    data: dict
+    etag: str | None
+    fresh: bool
+
+
+class MetadataCache:
+    def __init__(self, path: str, room_ttl: int = 600, account_ttl: int = 86400):
+        """On-disk cache for room roles, room tags and resolved accounts.
+        Lets restarts reconnect to known rooms and users without a burst of API calls.
+
+        Args:
+            path (str): Path to the SQLite database. Created if it doesn't exist.
+            room_ttl (int, optional): Seconds before room data has to be revalidated. Defaults to 600.
+            account_ttl (int, optional): Seconds before account data has to be fetched again. Defaults to 86400.
+        """
+        self.room_ttl = room_ttl
+        self.account_ttl = account_ttl
+
+        # Autocommit with WAL so role updates from the transmit loop stay cheap
+        self.db = sqlite3.connect(path, isolation_level=None)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.executescript("""
+            CREATE TABLE IF NOT EXISTS rooms (
+                room_id INTEGER PRIMARY KEY,
+                name TEXT NOT NULL,
+                data TEXT NOT NULL,
+                etag TEXT,
+                fetched_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS rooms_name ON rooms (name);
+            CREATE TABLE IF NOT EXISTS roles (
+                room_id INTEGER NOT NULL,
+                account_id INTEGER NOT NULL,
+                role INTEGER NOT NULL,
+                PRIMARY KEY (room_id, account_id)
+            );
+            CREATE TABLE IF NOT EXISTS accounts (
+                account_id INTEGER PRIMARY KEY,
+                username TEXT NOT NULL,
+                data TEXT NOT NULL,
+                fetched_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS accounts_username ON accounts (username);
+        """)
+
+    def get_room(self, room: str | int) -> CachedRoom | None:
+        """Returns cached room data. The roles include updates from our own role changes.
+
+        Args:
+            room (str | int): Room name or ID
+
+        Returns:
+            CachedRoom | None: Cached room if found
+        """
+        if isinstance(room, str):
+            row = self.db.execute("SELECT room_id, data, etag, fetched_at FROM rooms WHERE name = ?", (room.lower(),)).fetchone()
+        else:
+            row = self.db.execute("SELECT room_id, data, etag, fetched_at FROM rooms WHERE room_id = ?", (room,)).fetchone()
+        if not row: return None
+
+        room_id, data, etag, fetched_at = row
+        data = json.loads(data)
+        data["Roles"] = [
+            {"AccountId": account_id, "Role": role}
+            for account_id, role in self.db.execute("SELECT account_id, role FROM roles WHERE room_id = ?", (room_id,))
+        ]
+
+        return CachedRoom(data=data, etag=etag, fresh=time.time() - fetched_at < self.room_ttl)
+
+    def set_room(self, data: dict, etag: str | None = None) -> None:
+        """Saves room data fetched from the API.
+
+        Args:
+            data (dict): Room data from rooms.rec.net
+            etag (str | None, optional): ETag of the response. Defaults to None.
+        """
+        room_id = data["RoomId"]
+        roles = data.get("Roles", [])
+        stored = {k: v for k, v in data.items() if k != "Roles"}
+
+        with self.db:
+            self.db.execute("BEGIN")
+            self.db.execute(
+                "INSERT OR REPLACE INTO rooms VALUES (?, ?, ?, ?, ?)",
+                (room_id, data["Name"].lower(), json.dumps(stored), etag, time.time())
+            )
+            self.db.execute("DELETE FROM roles WHERE room_id = ?", (room_id,))
+            self.db.executemany(
+                "INSERT INTO roles VALUES (?, ?, ?)",
+                [(room_id, i["AccountId"], i["Role"]) for i in roles]
+            )
+
+    def touch_room(self, room_id: int) -> None:
+        """Marks cached room data as fresh after it was revalidated.
+
+        Args:
+            room_id (int): Room ID
+        """
+        self.db.execute("UPDATE rooms SET fetched_at = ? WHERE room_id = ?", (time.time(), room_id))
+
+    def set_role(self, room_id: int, account_id: int, role: int) -> None:
+        """Saves a role change made by the transmitter.
+
+        Args:
+            room_id (int): Room ID
+            account_id (int): Account ID
+            role (int): Role ID
+        """
+        self.db.execute("INSERT OR REPLACE INTO roles VALUES (?, ?, ?)", (room_id, account_id, role))
+
+    def get_account(self, user: str | int) -> dict | None:
+        """Returns cached account data if it hasn't expired.
+
+        Args:
+            user (str | int): Username or ID
+
+        Returns:
+            dict | None: Account data from RecNet
+        """
+        if isinstance(user, str):
+            row = self.db.execute("SELECT data, fetched_at FROM accounts WHERE username = ?", (user.lower(),)).fetchone()
+        else:
+            row = self.db.execute("SELECT data, fetched_at FROM accounts WHERE account_id = ?", (user,)).fetchone()
+        if not row or time.time() - row[1] >= self.account_ttl: return None
+
+        return json.loads(row[0])
+
+    def set_account(self, data: dict) -> None:
+        """Saves account data fetched from RecNet.
+
+        Args:
+            data (dict): Account data from RecNet
+        """
+        self.db.execute(
+            "INSERT OR REPLACE INTO accounts VALUES (?, ?, ?, ?)",
+            (data["accountId"], data["username"].lower(), json.dumps(data), time.time())
+        )
+
+    def close(self) -> None:
+        """Closes the database.
+        """
+        self.db.close()
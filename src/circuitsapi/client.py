@@ -1,25 +1,39 @@
 import asyncio
 import aiohttp
+import codecs
+import inspect
+import sys
 import recnetpy
 import time
 import jwt
-from typing import Optional, List
+from typing import TYPE_CHECKING, Any, Optional, List, Dict, Tuple, Callable, AsyncIterable, Iterable, AsyncIterator, IO
 from dataclasses import dataclass
 from recnetpy.dataclasses.account import Account
 from .helpers import *
 from .exceptions import *
 from .request import Request
-from recnetlogin import RecNetLogin
+from .cache import MetadataCache
+from .journal import Journal
+from .uplink import Uplink
+from .auth import TokenProvider, StaticTokenProvider, RecNetLoginProvider
+
+if TYPE_CHECKING:
+    from recnetlogin import RecNetLogin
 
 
 class Client:
-    def __init__(self, dev_token: str, rr_auth: str | None = None, debug_mode: bool = False):
+    def __init__(self, dev_token: str, rr_auth: "str | TokenProvider | RecNetLogin | None" = None, debug_mode: bool = False, cache_path: str | None = None, journal_path: str | None = None):
         """CV2 transmitter client that oversees all the connections.
 
         Args:
             dev_token (str): RR API token from devportal.rec.net
-            rr_auth (str | None): RR access token or nothing. If left empty, defaults to RecNetLogin.
+            rr_auth (str | TokenProvider | RecNetLogin | None): RR access token, a token provider, a RecNetLogin instance or nothing. If left empty, defaults to RecNetLogin.
             debug_mode (bool, optional): Debug mode. Defaults to False.
+            cache_path (str | None, optional): Path to an on-disk cache for room and account metadata. Defaults to None.
+            journal_path (str | None, optional): Path to a journal that records every role change sent. Defaults to None.
+
+        Raises:
+            TypeError: Raised if rr_auth is of an unsupported type.
         """
         # Dev token
         self.dev_token = dev_token
@@ -35,22 +49,45 @@ class Client:
         # host account ID
         self.host_account_id = 0
 
-        # Determine login method
+        # Determine login method. The token is fetched when the client is initialized.
         if isinstance(rr_auth, str):
-            self.headers["Authorization"] = "Bearer " + rr_auth
-            self.access_token = rr_auth
-        else:
+            self.token_provider = StaticTokenProvider(rr_auth)
+        elif isinstance(rr_auth, TokenProvider):
+            self.token_provider = rr_auth
+        elif "recnetlogin" in sys.modules and isinstance(rr_auth, sys.modules["recnetlogin"].RecNetLogin):
+            # An instance can only exist if RecNetLogin was imported, so it doesn't need to be imported here
+            self.token_provider = RecNetLoginProvider(rnl=rr_auth)
+        elif rr_auth is None:
             # Attempt to login with RecNetLogin
-            rnl = RecNetLogin()
-            token = rnl.get_token()
-            self.headers["Authorization"] = "Bearer " + token
-            self.access_token = token
+            self.token_provider = RecNetLoginProvider()
+        else:
+            raise TypeError(f"rr_auth must be an access token, a TokenProvider, a RecNetLogin instance or None, not {type(rr_auth).__name__}.")
+
+        # Seconds before the token expires to refresh it
+        self.refresh_margin = 600
+        self.auth_lock = asyncio.Lock()
 
         # clients
         self.session: aiohttp.ClientSession | None = None
         self.RecNet: recnetpy.Client | None = None
         self.auth_task: asyncio.Task = None
 
+        # room and account metadata cache
+        self.cache_path = cache_path
+        self.cache: MetadataCache | None = None
+
+        # transmission journal
+        self.journal_path = journal_path
+        self.journal: Journal | None = None
+
+        # Usage stats
+        self.request_count = 0
+        self.throttled_count = 0
+
+        # Rate limiting. Listeners are called with the client when it gets throttled.
+        self.throttled_until = 0.0
+        self.throttle_listeners: List[Callable[["Client"], None]] = []
+
         # debug mode for printing
         self.debug = debug_mode
 
@@ -61,10 +98,17 @@ class Client:
         """Initialize the client for usage. Must be ran.
         """
         if self.initialized: return
+
+        # Fetch the access token
+        self.__set_token(await self.token_provider.get_token())
         
         # Initialize aiohttp and recnetpy
         self.session = aiohttp.ClientSession(headers=self.headers, cookies=self.cookies)
         self.RecNet = recnetpy.Client(api_key=self.dev_token)
+        if self.cache_path:
+            self.cache = MetadataCache(self.cache_path)
+        if self.journal_path:
+            self.journal = Journal(self.journal_path)
             
         # Read token properties
         decoded_token = self.__decode_token(self.access_token)
@@ -75,24 +119,61 @@ class Client:
         if not self.access_to_matchmaking:
             print("WARNING: Your access token is lacking the 'rn.match.read' scope. This will limit functionality.")
 
+        # Keep the token fresh in the background
+        if self.token_provider.refreshable:
+            self.auth_task = asyncio.create_task(self.__refresh_token_loop())
+
         self.initialized = True
 
-    async def send_request(self, method: str, url: str, payload: str | dict = {}) -> aiohttp.ClientResponse:
+    async def refresh_token(self, expired: str | None = None) -> None:
+        """Fetches a new access token from the token provider and swaps it on the session.
+        Requests that are already in-flight are not affected.
+
+        Args:
+            expired (str | None, optional): Token that was rejected. If it has already been replaced, nothing is done. Defaults to None.
+        """
+        async with self.auth_lock:
+            if expired and expired != self.access_token: return
+            self.__set_token(await self.token_provider.get_token())
+
+    async def send_request(self, method: str, url: str, payload: str | dict = {}, headers: dict | None = None) -> aiohttp.ClientResponse:
         """Sends an API request
 
         Args:
             method (str): Request method
             url (str): Request URL
             payload (str | dict, optional): Request payload. Defaults to {}.
+            headers (dict | None, optional): Extra request headers. Defaults to None.
 
         Returns:
             aiohttp.ClientResponse: aiohttp response
         """
-        request = Request(self.session, method, url, payload)
+        token = self.access_token
+        request = Request(self.session, method, url, payload, headers)
         response = await request.send_request()
+
+        # Token expired mid-transmission, refresh it and try again
+        if response.status == 401 and self.token_provider.refreshable:
+            await self.refresh_token(expired=token)
+            request = Request(self.session, method, url, payload, headers)
+            response = await request.send_request()
+
+        # Usage stats
+        self.request_count += 1
+        if response.status == 429:
+            self.throttled_count += 1
+            self.throttled_until = time.time() + self.__retry_after(response)
+            for listener in self.throttle_listeners:
+                listener(self)
+
         print(f"{method.upper()} {url} DATA: {payload} - {response.status}")
         return response
 
+    @property
+    def is_throttled(self) -> bool:
+        """True if the API has rate limited the host account and the limit hasn't passed yet."""
+        return time.time() < self.throttled_until
+
     async def connect_to_room(self, room: str | int):
         """Create a connection to a room. You will then be able to target a specific user to transmit data.
 
@@ -106,6 +187,44 @@ class Client:
         await conn.initialize()
         return conn
     
+    def __retry_after(self, response: aiohttp.ClientResponse) -> float:
+        """Returns how many seconds to wait after a rate limited response
+
+        Args:
+            response (aiohttp.ClientResponse): Rate limited response
+
+        Returns:
+            float: Seconds to wait. Defaults to 60 if the response doesn't say.
+        """
+        try:
+            return float(response.headers.get("Retry-After", 60))
+        except ValueError:
+            return 60
+
+    def __set_token(self, token: str) -> None:
+        """Sets the access token used by the client
+
+        Args:
+            token (str): A bearer token
+        """
+        self.access_token = token
+        self.headers["Authorization"] = "Bearer " + token
+        if self.session:
+            self.session.headers["Authorization"] = "Bearer " + token
+
+    async def __refresh_token_loop(self) -> None:
+        """Refreshes the access token before it expires.
+        """
+        while True:
+            exp = self.__decode_token(self.access_token).get("exp")
+            if not exp: return
+
+            await asyncio.sleep(max(exp - self.refresh_margin - time.time(), 30))
+            try:
+                await self.refresh_token()
+            except Exception as e:
+                print(f"Failed to refresh the access token: {e}")
+    
     def __decode_token(self, token: str) -> dict:
         """Decodes a bearer token
 
@@ -133,7 +252,13 @@ class Client:
         """
         await self.session.close()
         await self.RecNet.close()
-        #await self.auth_task.cancel()
+        if self.cache:
+            self.cache.close()
+        if self.journal:
+            self.journal.close()
+        if self.auth_task:
+            self.auth_task.cancel()
+        await self.token_provider.close()
 
 class RoomConnection:
     def __init__(self, room: str | int, client: Client):
@@ -175,15 +300,30 @@ class RoomConnection:
             RoomNotFound: Raised if the specified room doesn't exist or the user doesn't have permissions to it.
             InvalidRoomConnection: Raised if the user is a co-owner or owner of the room.
         """
-        if self.room_name:
-            resp = await self.client.send_request("get", f"https://rooms.rec.net/rooms/?name={self.room_name}&include=12")
-        elif self.room_id:
-            resp = await self.client.send_request("get", f"https://rooms.rec.net/rooms/{self.room_id}?include=12")
+        cache = self.client.cache
+        cached = cache.get_room(self.room_name or self.room_id) if cache else None
 
-        if resp.status != 200:
-            raise RoomNotFound
+        if cached and cached.fresh:
+            room = cached.data
+        else:
+            # Revalidate stale cache entries
+            headers = {"If-None-Match": cached.etag} if cached and cached.etag else None
+
+            if self.room_name:
+                resp = await self.client.send_request("get", f"https://rooms.rec.net/rooms/?name={self.room_name}&include=12", headers=headers)
+            elif self.room_id:
+                resp = await self.client.send_request("get", f"https://rooms.rec.net/rooms/{self.room_id}?include=12", headers=headers)
+
+            if resp.status == 304:
+                room = cached.data
+                cache.touch_room(room["RoomId"])
+            elif resp.status == 200:
+                room = await resp.json()
+                if cache:
+                    cache.set_room(room, resp.headers.get("ETag"))
+            else:
+                raise RoomNotFound
 
-        room = await resp.json()
         self.roles = room["Roles"]
         self.room_id = room['RoomId']
         self.room_name = room['Name']
@@ -219,19 +359,50 @@ class RoomConnection:
             UserNotFound: Raised if the user doesn't exist.
             UserNotInRoom: Raised if the user is not in the room.
 
+        Returns:
+            UserConnection: Connection to the user.
+        """
+        return await self.__connect(user, UserConnection)
+
+
+    async def connect_to_bus(self, relay: str | int) -> "BusConnection":
+        """Creates a bus connection through a dedicated relay account.
+        Packets sent on the bus are re-broadcast in-game, so room-wide messages only need one stream of role changes.
+
+        Args:
+            relay (str | int): Username or ID of the relay account
+
+        Raises:
+            UserNotFound: Raised if the relay account doesn't exist.
+            UserNotInRoom: Raised if the relay account is not in the room.
+
+        Returns:
+            BusConnection: Connection to the bus.
+        """
+        return await self.__connect(relay, BusConnection)
+
+
+    async def __connect(self, user: str | int, connection_class: type) -> "UserConnection":
+        """Finds the user and creates a connection to them.
+
+        Args:
+            user (str | int): Username or ID
+            connection_class (type): UserConnection or a subclass of it
+
         Returns:
             UserConnection: Connection to the user.
         """
         # Find user
-        if isinstance(user, int):
-            account = await self.RecNet.accounts.fetch(user)
-        elif isinstance(user, str):
-            account = await self.RecNet.accounts.get(user)
-        else:
-            account = None
-        if not account: raise UserNotFound
+        account = self.__get_cached_account(user)
+        if not account:
+            if isinstance(user, int):
+                account = await self.RecNet.accounts.fetch(user)
+            elif isinstance(user, str):
+                account = await self.RecNet.accounts.get(user)
+            if not account: raise UserNotFound
+            self.__cache_account(account)
 
-        conn = UserConnection(account=account, room_connection=self)
+        conn = connection_class(account=account, room_connection=self)
 
         if self.client.access_to_matchmaking:
             # Check if the player is in the room
@@ -242,7 +413,156 @@ class RoomConnection:
         else:
             # Can't check if the player is in the room
             return conn
-            
+
+
+    async def connect_to_users(self, users: List[str | int]) -> Tuple[Dict[str | int, "UserConnection"], Dict[str | int, TransmitterException]]:
+        """Creates connections to multiple users at once.
+
+        Accounts are resolved with bulk lookups and the in-room check is done with a single matchmaking request,
+        so connecting a whole lobby doesn't take two round-trips per user.
+
+        Args:
+            users (List[str | int]): Usernames or IDs
+
+        Returns:
+            Tuple[Dict[str | int, UserConnection], Dict[str | int, TransmitterException]]: Connections and failures, keyed by the given username or ID. Keys of the same account share its connection.
+        """
+        connections = {}
+        failures = {}
+
+        # Usernames aren't case sensitive
+        def lookup_key(user: str | int) -> str | int:
+            return user.lower() if isinstance(user, str) else user
+
+        # Remove duplicates while keeping the order
+        users = list(dict.fromkeys(users))
+        lookups = list(dict.fromkeys(lookup_key(i) for i in users))
+
+        # Use cached accounts where possible
+        accounts = {}
+        for user in lookups:
+            account = self.__get_cached_account(user)
+            if account:
+                accounts[user] = account
+
+        ids = [i for i in lookups if isinstance(i, int) and i not in accounts]
+        names = [i for i in lookups if isinstance(i, str) and i not in accounts]
+
+        # Find the rest of the users
+        by_id, by_name = await asyncio.gather(
+            self.RecNet.accounts.fetch_many(ids) if ids else asyncio.sleep(0, []),
+            self.RecNet.accounts.get_many(names) if names else asyncio.sleep(0, [])
+        )
+        accounts.update({i.id: i for i in by_id})
+        accounts.update({i.username.lower(): i for i in by_name})
+        for account in by_id + by_name:
+            self.__cache_account(account)
+
+        # One connection per account, even if it was given by both username and ID,
+        # so every key of the account shares the same role state
+        by_account = {}
+        for user in users:
+            account = accounts.get(lookup_key(user))
+            if not account:
+                failures[user] = UserNotFound()
+                continue
+
+            if account.id not in by_account:
+                try:
+                    by_account[account.id] = UserConnection(account=account, room_connection=self)
+                except TransmitterException as e:
+                    by_account[account.id] = e
+
+            result = by_account[account.id]
+            if isinstance(result, TransmitterException):
+                failures[user] = result
+            else:
+                connections[user] = result
+
+        if self.client.access_to_matchmaking and connections:
+            # Check if the players are in the room
+            instances = await self.get_instances([i for i, conn in by_account.items() if isinstance(conn, UserConnection)])
+            for user, conn in list(connections.items()):
+                instance = instances.get(conn.account.id)
+                if not instance or instance.get("roomId") != self.room_id:
+                    failures[user] = UserNotInRoom()
+                    del connections[user]
+
+        return connections, failures
+
+
+    async def get_instances(self, account_ids: List[int]) -> Dict[int, dict | None]:
+        """Returns the instances of multiple players with a single request.
+
+        Args:
+            account_ids (List[int]): Account IDs
+
+        Raises:
+            LackingScope: Raised if the access token lacks the 'rn.match.read' scope.
+
+        Returns:
+            Dict[int, dict | None]: Instance data by account ID. None if the player isn't in an instance.
+        """
+        # Check if the client can access matchmaking data
+        if not self.client.access_to_matchmaking:
+            raise LackingScope('rn.match.read')
+
+        instances = {i: None for i in account_ids}
+        query = "&".join(f"id={i}" for i in account_ids)
+        resp = await self.client.send_request("get", f"https://match.rec.net/player?{query}")
+        if resp.status != 200: return instances
+
+        for i in await resp.json():
+            if i.get("playerId") in instances:
+                instances[i["playerId"]] = i.get("roomInstance")
+
+        return instances
+
+
+    def update_role(self, account_id: int, role: int) -> None:
+        """Records a role change made by the transmitter, so the room's roles stay accurate.
+
+        Args:
+            account_id (int): Account ID
+            role (int): Role ID
+        """
+        for i in self.roles:
+            if i["AccountId"] == account_id:
+                i["Role"] = role
+                break
+        else:
+            self.roles.append({"AccountId": account_id, "Role": role})
+
+        if self.client.cache:
+            self.client.cache.set_role(self.room_id, account_id, role)
+
+
+    def __get_cached_account(self, user: str | int) -> Account | None:
+        """Returns an account from the metadata cache
+
+        Args:
+            user (str | int): Username or ID
+
+        Returns:
+            Account | None: Account if cached
+        """
+        if not self.client.cache: return None
+
+        data = self.client.cache.get_account(user)
+        if not data: return None
+
+        return self.RecNet.accounts.create_dataclass(data["accountId"], data)
+
+
+    def __cache_account(self, account: Account) -> None:
+        """Saves an account to the metadata cache
+
+        Args:
+            account (Account): Account dataclass from recnetpy
+        """
+        if self.client.cache and account.data:
+            self.client.cache.set_account(account.data)
+
 
     async def find_players(self) -> Optional[List[int]]:
         """Searches for players in the room using room images taken in the past 10 minutes.
@@ -312,6 +632,15 @@ class UserConnection:
         self.transmitting_packets = False
         self.latest_bit_timestamp = 0  # For detecting timeouts
 
+        # Receive channel from the game
+        self.uplink = Uplink(self)
+
+        # Transmitter pool room the connection belongs to, if any
+        self.pool = None
+
+        # Rate limited role changes are retried this many times before giving up
+        self.max_rate_limit_retries = 5
+
 
     # Packet Handler dependency functions
 
@@ -325,25 +654,7 @@ class UserConnection:
         Args:
             text (str): Text to transmit
         """
-        chars = [*text]
-        packets = []
-        for c in chars:
-            if c in self.characters:
-                packets.append(
-                    int(f"{self.characters.index(c):b}")
-                )
-
-        # Transmit packet count
-        packet_count = len(packets)
-        await self.__transmit_packet_count(packet_count)
-        print(f"Packet count: {packet_count}")
-
-        # Transmit packets
-        for i, packet in enumerate(packets, start=1):
-            await self.__transmit_packet(packet)
-            print(f"Packet {i}/{len(packets)} - bits: {packet} - int: {int(str(packet), 2)}")
-
-        # Done!
+        await self._send_packets(self._encode_text(text))
             
 
     async def send_int_packet(self, packet: int):
@@ -354,17 +665,45 @@ class UserConnection:
         Args:
             packet (int): Integer to transmit
         """
+        await self._send_packets([int(f"{packet:b}")])
 
-        # Transmit packet count
-        packet_count = 1
-        await self.__transmit_packet_count(packet_count)
-        print(f"Packet count: {packet_count}")
 
-        # Transmit packet
-        await self.__transmit_packet(int(f"{packet:b}"))
-        print(f"Packet {packet} - bits: {int(f"{packet:b}")} SENT!")
+    async def send_stream(self, source: AsyncIterable[str | bytes] | Iterable[str | bytes] | IO, chunk_size: int = 32):
+        """Sends text as it arrives from an async iterable, an iterable or a file-like object.
 
-        # Done!
+        The text is sent in chunks, each framed like a text packet with its own packet count.
+        A chunk with a packet count of 0 terminates the stream.
+        The next piece of data is only read once the previous chunk has been sent,
+        so memory use stays constant and transmission starts right away.
+
+        REQUIREMENTS:
+            - 'Receiver' circuit board must be connected to 'Packet Handler' circuit board for the packets to be decoded.
+            - 'Decimal to Character' circuit board must be used to convert packets to the corresponding characters.
+            - The in-game circuits must keep reading payloads until one with a packet count of 0 arrives.
+
+        Args:
+            source (AsyncIterable[str | bytes] | Iterable[str | bytes] | IO): Text source. Bytes are decoded as UTF-8.
+            chunk_size (int, optional): Maximum amount of characters per chunk. Defaults to 32.
+
+        Raises:
+            ValueError: Raised if chunk_size isn't positive.
+        """
+        await self._send_stream(source, chunk_size, [])
+
+
+    async def receive(self, timeout: float | None = None) -> List[int] | Any:
+        """Waits for the next message from the game through the uplink.
+        Configure 'uplink' to decode data instead of receiving every state change.
+
+        Requires 'rn.match.read' scope in access token if the default uplink source is used.
+
+        Args:
+            timeout (float | None, optional): Seconds to wait. Defaults to None.
+
+        Returns:
+            List[int] | Any: Packets of a payload if the uplink has symbols, otherwise the new state
+        """
+        return await self.uplink.receive(timeout)
 
 
     async def ping(self) -> bool:
@@ -466,6 +805,109 @@ class UserConnection:
 
     # Backend functions
 
+    def _encode_text(self, text: str) -> List[int]:
+        """Encodes text into packets for the 'Decimal to Character' circuit board. Unsupported characters are skipped.
+
+        Args:
+            text (str): Text to encode
+
+        Returns:
+            List[int]: Packets as binary numbers
+        """
+        packets = []
+        for c in text:
+            if c in self.characters:
+                packets.append(
+                    int(f"{self.characters.index(c):b}")
+                )
+        return packets
+
+
+    async def _send_stream(self, source: AsyncIterable[str | bytes] | Iterable[str | bytes] | IO, chunk_size: int, header: List[int]):
+        """Sends text from a stream source in chunks, each starting with the header packets.
+        The terminating chunk only contains the header packets.
+
+        Args:
+            source (AsyncIterable[str | bytes] | Iterable[str | bytes] | IO): Text source. Bytes are decoded as UTF-8.
+            chunk_size (int): Maximum amount of characters per chunk
+            header (List[int]): Packets sent at the start of every chunk
+
+        Raises:
+            ValueError: Raised if chunk_size isn't positive.
+            UnicodeDecodeError: Raised if the bytes aren't valid UTF-8, including a truncated character at the end. The stream isn't terminated.
+        """
+        if chunk_size <= 0:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}.")
+
+        decoder = codecs.getincrementaldecoder("utf-8")()
+
+        async def send(data: str):
+            # Split big pieces of data so every chunk stays small
+            for i in range(0, len(data), chunk_size):
+                packets = self._encode_text(data[i:i + chunk_size])
+                if packets:
+                    await self._send_packets(header + packets)
+
+        async for data in self.__read_stream(source, chunk_size):
+            if isinstance(data, bytes):
+                data = decoder.decode(data)
+            await send(data)
+
+        # Flush a truncated multi-byte sequence at the end of the source
+        await send(decoder.decode(b"", final=True))
+
+        # Terminate the stream
+        await self._send_packets(header)
+
+
+    async def __read_stream(self, source: AsyncIterable[str | bytes] | Iterable[str | bytes] | IO, chunk_size: int) -> AsyncIterator[str | bytes]:
+        """Yields data from a stream source without blocking the event loop.
+
+        Args:
+            source (AsyncIterable[str | bytes] | Iterable[str | bytes] | IO): Text source
+            chunk_size (int): Amount of characters or bytes to read from file-like objects at once
+
+        Returns:
+            AsyncIterator[str | bytes]: Data as it arrives
+        """
+        if isinstance(source, (str, bytes)):
+            yield source
+        elif hasattr(source, "read"):
+            # Async file-like objects are awaited, regular files are read in a thread
+            while True:
+                if inspect.iscoroutinefunction(source.read):
+                    data = await source.read(chunk_size)
+                else:
+                    data = await asyncio.to_thread(source.read, chunk_size)
+                if not data: break
+                yield data
+        elif hasattr(source, "__aiter__"):
+            async for data in source:
+                yield data
+        else:
+            for data in source:
+                yield data
+
+
+    async def _send_packets(self, packets: List[int]):
+        """Sends the packet count followed by the packets to the 'Packet Handler' circuit board.
+
+        Args:
+            packets (List[int]): Packets as binary numbers
+        """
+        # Transmit packet count
+        packet_count = len(packets)
+        await self.__transmit_packet_count(packet_count)
+        print(f"Packet count: {packet_count}")
+
+        # Transmit packets
+        for i, packet in enumerate(packets, start=1):
+            await self.__transmit_packet(packet)
+            print(f"Packet {i}/{len(packets)} - bits: {packet} - int: {int(str(packet), 2)}")
+
+        # Done!
+
+
     def __get_current_role(self) -> str:
         """Returns the current role of the connected account
 
@@ -507,7 +949,6 @@ class UserConnection:
         """
         self.transmitting_packets = False
         self.latest_bit_timestamp = 0
-        payload = "role="
 
         # Check if it's the same bit as before
         if self.previous_role == "0":
@@ -515,11 +956,8 @@ class UserConnection:
         else:
             role_id = "0"
 
-        payload += role_id
         self.previous_role = role_id
-
-        resp = await self.client.send_request("put", f"https://rooms.rec.net/rooms/{self.room_id}/roles/{self.account.id}", payload=payload)
-        return resp.status == 200
+        return await self.__set_role(role_id)
 
 
     async def __transmit_bit(self, bit: int) -> bool:
@@ -552,8 +990,6 @@ class UserConnection:
         contributor - id 25 - repeat previous bit
         """
 
-        payload = "role="
-
         # Check if it's the same role as before
         if self.previous_role == bit_keys[bit]:
             # id 25 - contributor - repeat previous bit
@@ -562,18 +998,160 @@ class UserConnection:
             # Not the same role as before
             role_id = bit_keys[bit]  
 
-        payload += role_id
         self.previous_role = role_id
 
         # Send signal to user
-        resp = await self.client.send_request("put", f"https://rooms.rec.net/rooms/{self.room_id}/roles/{self.account.id}", payload)
+        success = await self.__set_role(role_id)
 
         # Save the timestamp this bit was sent.
         # If the next bit takes over 10 seconds to send, the payload has timed out in-game.
         if self.transmitting_packets:
             self.latest_bit_timestamp = time.time()
 
+        return success
+
+
+    async def __set_role(self, role_id: str) -> bool:
+        """Sets the role of the connected account, which is what the 'Receiver' circuit board reads.
+
+        Args:
+            role_id (str): Role ID
+
+        Returns:
+            bool: Was it successful?
+        """
+        client = self.client
+        resp = await self.__put_role(client, role_id)
+
+        # The previous role has already moved on, so a dropped role change would corrupt the following signals.
+        # Retry rate limited role changes instead of losing them.
+        retries = 0
+        while resp.status == 429 and retries < self.max_rate_limit_retries:
+            retries += 1
+
+            # Unless a transmitter pool already swapped out the throttled host account, wait for one to recover
+            if self.client is client:
+                if self.pool:
+                    await self.pool.wait_for_account(self)
+                else:
+                    await asyncio.sleep(max(client.throttled_until - time.time(), 0))
+
+            client = self.client
+            resp = await self.__put_role(client, role_id)
+
+        if resp.status == 200:
+            self.room_conn.update_role(self.account.id, int(role_id))
+            self.uplink.wake()
         return resp.status == 200
-    
 
-    
\ No newline at end of file
+
+    async def __put_role(self, client: Client, role_id: str) -> aiohttp.ClientResponse:
+        """Sends the role change request and records it to the client's journal.
+
+        Args:
+            client (Client): Client of the host account
+            role_id (str): Role ID
+
+        Returns:
+            aiohttp.ClientResponse: aiohttp response
+        """
+        # Send time for replays, monotonic clock for the latency
+        sent_at = time.time()
+        start = time.perf_counter()
+        resp = await client.send_request("put", f"https://rooms.rec.net/rooms/{self.room_id}/roles/{self.account.id}", "role=" + role_id)
+
+        if client.journal:
+            client.journal.record(sent_at, self.room_id, self.account.id, int(role_id), resp.status, time.perf_counter() - start)
+        return resp
+
+
+class BusConnection(UserConnection):
+    def __init__(self, account: Account, room_connection: RoomConnection):
+        """Connection to a relay account that re-broadcasts packets in-game to the subscribed players.
+        This class should be generated via the room connection.
+
+        Every payload on the bus starts with a header packet that addresses it.
+        Account and group IDs must be positive integers.
+            - 0: Every subscribed player
+            - Account ID shifted left by one: A single player
+            - Group ID shifted left by one, plus one: Every player subscribed to the group
+
+        REQUIREMENTS:
+            - 'Receiver' circuit board must read the relay account's role instead of the local player's.
+            - The relay circuits must compare the header to the local player and their groups before decoding the payload.
+
+        Args:
+            account (Account): Account dataclass of the relay account from recnetpy
+            room_connection (RoomConnection): Initialized RoomConnection class.
+        """
+        super().__init__(account, room_connection)
+
+
+    async def send_text_packet(self, text: str, recipient: int | None = None, group: int | None = None):
+        """Sends a text packet on the bus. Broadcast to every subscribed player if no recipient or group is given.
+
+        Args:
+            text (str): Text to transmit
+            recipient (int | None, optional): Account ID of the recipient. Defaults to None.
+            group (int | None, optional): Group ID of the recipients. Defaults to None.
+        """
+        await self._send_packets([self.__header(recipient, group), *self._encode_text(text)])
+
+
+    async def send_int_packet(self, packet: int, recipient: int | None = None, group: int | None = None):
+        """Sends an integer packet on the bus. Broadcast to every subscribed player if no recipient or group is given.
+
+        Args:
+            packet (int): Integer to transmit
+            recipient (int | None, optional): Account ID of the recipient. Defaults to None.
+            group (int | None, optional): Group ID of the recipients. Defaults to None.
+        """
+        await self._send_packets([self.__header(recipient, group), int(f"{packet:b}")])
+
+
+    async def send_stream(self, source: AsyncIterable[str | bytes] | Iterable[str | bytes] | IO, chunk_size: int = 32, recipient: int | None = None, group: int | None = None):
+        """Streams text on the bus. Broadcast to every subscribed player if no recipient or group is given.
+
+        Every chunk starts with the header packet. The stream is terminated by a chunk that only contains the header.
+
+        Args:
+            source (AsyncIterable[str | bytes] | Iterable[str | bytes] | IO): Text source. Bytes are decoded as UTF-8.
+            chunk_size (int, optional): Maximum amount of characters per chunk. Defaults to 32.
+            recipient (int | None, optional): Account ID of the recipient. Defaults to None.
+            group (int | None, optional): Group ID of the recipients. Defaults to None.
+
+        Raises:
+            ValueError: Raised if chunk_size isn't positive.
+        """
+        await self._send_stream(source, chunk_size, [self.__header(recipient, group)])
+
+
+    def __header(self, recipient: int | None, group: int | None) -> int:
+        """Returns the header packet that addresses a payload.
+
+        Args:
+            recipient (int | None): Account ID of the recipient
+            group (int | None): Group ID of the recipients
+
+        Raises:
+            ValueError: Raised if both a recipient and a group are given, or if either isn't a positive integer.
+
+        Returns:
+            int: Header as a binary number
+        """
+        if recipient is not None and group is not None:
+            raise ValueError("A packet can be addressed to a recipient or a group, not both.")
+
+        # 0 is the broadcast header and negative numbers can't be transmitted
+        for name, value in (("recipient", recipient), ("group", group)):
+            if value is not None and (not isinstance(value, int) or value <= 0):
+                raise ValueError(f"The {name} must be a positive integer, got {value!r}.")
+
+        if recipient is not None:
+            address = recipient << 1
+        elif group is not None:
+            address = group << 1 | 1
+        else:
+            address = 0
+
+        return int(f"{address:b}")
@@ -0,0 +1,85 @@
+from typing import Dict, List
+from .helpers import supported_characters
+
+
+class CircuitEmulator:
+    def __init__(self):
+        """Local stand-in for the in-game 'Receiver' and 'Packet Handler' circuit boards.
+        Decodes role changes back into packets and payloads, for debugging and benchmarking without the game.
+
+        Role signals:
+            - 10: Bit 1
+            - 20: Bit 0
+            - 25: Repeat the previous signal
+            - 0: End of packet
+        """
+        # Decoder state of each account
+        self.previous_signal: Dict[int, str] = {}
+        self.bits: Dict[int, List[str]] = {}
+        self.remaining: Dict[int, int | None] = {}
+        self.current: Dict[int, List[int]] = {}
+
+        # Decoded payloads of each account
+        self.payloads: Dict[int, List[List[int]]] = {}
+
+    def feed(self, account_id: int, role: int) -> List[int] | None:
+        """Feeds a role change to the emulator.
+
+        Args:
+            account_id (int): Account whose role was changed
+            role (int): New role ID
+
+        Returns:
+            List[int] | None: Packets of a payload, if the role change completed one
+        """
+        role_signals = {10: "1", 20: "0", 0: "end"}
+
+        if role == 25:
+            signal = self.previous_signal.get(account_id)
+            if signal is None: return None
+        elif role in role_signals:
+            signal = role_signals[role]
+        else:
+            return None
+        self.previous_signal[account_id] = signal
+
+        if signal != "end":
+            self.bits.setdefault(account_id, []).append(signal)
+            return None
+
+        # Bits are sent starting from the least significant one
+        bits = self.bits.pop(account_id, [])
+        packet = int("".join(reversed(bits)), 2) if bits else 0
+        return self.__handle_packet(account_id, packet)
+
+    def decode_text(self, payload: List[int]) -> str:
+        """Converts a payload to text like the 'Decimal to Character' circuit board.
+
+        Args:
+            payload (List[int]): Packets of a payload
+
+        Returns:
+            str: Decoded text
+        """
+        characters = supported_characters()
+        return "".join(characters[i] if i < len(characters) else "?" for i in payload)
+
+    def __handle_packet(self, account_id: int, packet: int) -> List[int] | None:
+        """Groups packets into payloads like the 'Packet Handler' circuit board. The first packet is the packet count.
+        """
+        remaining = self.remaining.get(account_id)
+        if remaining is None:
+            remaining = packet
+            self.current[account_id] = []
+        else:
+            self.current[account_id].append(packet)
+            remaining -= 1
+
+        if remaining > 0:
+            self.remaining[account_id] = remaining
+            return None
+
+        self.remaining[account_id] = None
+        payload = self.current.pop(account_id)
+        self.payloads.setdefault(account_id, []).append(payload)
+        return payload
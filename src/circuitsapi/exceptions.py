@@ -4,6 +4,11 @@ class TransmitterException(Exception):
     Ideally speaking, this could be caught to handle any exceptions raised from this library.
     """
 
+    def __reduce__(self):
+        # Subclasses build their own messages, so restore the args without calling __init__.
+        # Lets exceptions raised in fleet workers be raised again in the parent process.
+        return (self.__class__.__new__, (self.__class__,), {"args": self.args})
+
 class RoomNotFound(TransmitterException):
     def __init__(self):            
         super().__init__("Room not found! If the room is private, make sure the host account is a co-owner.")
@@ -34,4 +39,9 @@ class InvalidRoomConnection(TransmitterException):
 class LackingScope(TransmitterException):
     """Raised when trying to fetch data without the necessary scope in access token."""
     def __init__(self, scope: str) -> None:
-        super().__init__(f"Cannot fetch data because your access token lacks the {scope} scope.")
\ No newline at end of file
+        super().__init__(f"Cannot fetch data because your access token lacks the {scope} scope.")
+
+class WorkerDied(TransmitterException):
+    """Raised when a fleet worker process exits before finishing its commands."""
+    def __init__(self, shard: int) -> None:
+        super().__init__(f"Fleet worker {shard} has exited. Commands to its rooms can't be run.")
\ No newline at end of file
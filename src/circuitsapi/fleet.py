@@ -0,0 +1,400 @@
+import asyncio
+import multiprocessing
+import multiprocessing.connection
+import os
+import pickle
+import threading
+import time
+from typing import Dict, List
+from .client import Client, RoomConnection, UserConnection
+from .auth import TokenProvider
+from .exceptions import TransmitterException, WorkerDied
+
+
+class Fleet:
+    def __init__(self, dev_token: str, rr_auth: str | TokenProvider | None = None, workers: int | None = None, debug_mode: bool = False, cache_path: str | None = None):
+        """Manages many rooms by sharding them across worker processes.
+        Each worker runs its own event loop and client, so transmitter capacity scales with cores.
+
+        Args:
+            dev_token (str): RR API token from devportal.rec.net
+            rr_auth (str | TokenProvider | None, optional): RR access token, a picklable token provider or nothing. If left empty, each worker defaults to RecNetLogin.
+            workers (int | None, optional): Amount of worker processes. Defaults to the CPU count.
+            debug_mode (bool, optional): Debug mode. Defaults to False.
+            cache_path (str | None, optional): Path to an on-disk cache shared by the workers. Defaults to None.
+        """
+        self.client_args = (dev_token, rr_auth, debug_mode, cache_path)
+        self.worker_count = workers or os.cpu_count() or 1
+
+        # Workers communicate through queues, one for commands per worker and one shared for results
+        self.context = multiprocessing.get_context("spawn")
+        self.processes: List[multiprocessing.Process] = []
+        self.command_queues: List[multiprocessing.Queue] = []
+        self.result_queue: multiprocessing.Queue | None = None
+        self.result_thread: threading.Thread | None = None
+        self.watch_thread: threading.Thread | None = None
+
+        # Pending commands by ID, and the worker each one was sent to
+        self.pending: Dict[int, asyncio.Future] = {}
+        self.pending_shards: Dict[int, int] = {}
+        self.next_command_id = 0
+        self.loop: asyncio.AbstractEventLoop | None = None
+
+        # Which worker each room is sharded to
+        self.rooms: Dict[str | int, int] = {}
+
+        # Workers that have exited unexpectedly
+        self.dead_shards: set = set()
+        self.closing = False
+
+        # Initialized
+        self.initialized = False
+
+    async def initialize(self):
+        """Starts the worker processes. Must be ran.
+        """
+        if self.initialized: return
+
+        self.loop = asyncio.get_running_loop()
+        self.result_queue = self.context.Queue()
+        for i in range(self.worker_count):
+            commands = self.context.Queue()
+            process = self.context.Process(target=_run_worker, args=(self.client_args, commands, self.result_queue), daemon=True)
+            process.start()
+            self.command_queues.append(commands)
+            self.processes.append(process)
+
+        # Results are read in a thread so the event loop never blocks on the queue
+        self.result_thread = threading.Thread(target=self.__read_results, daemon=True)
+        self.result_thread.start()
+
+        # Fail the commands of workers that die
+        self.watch_thread = threading.Thread(target=self.__watch_workers, daemon=True)
+        self.watch_thread.start()
+
+        self.initialized = True
+
+    async def add_room(self, room: str | int) -> int:
+        """Connects to a room in the least loaded worker.
+
+        Args:
+            room (str | int): Room name or ID. Use the same value when sending to the room.
+
+        Returns:
+            int: Index of the worker the room was sharded to
+        """
+        if room in self.rooms: return self.rooms[room]
+
+        loads = [0] * self.worker_count
+        for i in self.rooms.values():
+            loads[i] += 1
+        shard = loads.index(min(loads))
+
+        # Reserve the shard, so concurrent calls see the load and don't add the same room twice
+        self.rooms[room] = shard
+        try:
+            await self.__send_command(shard, "add_room", room)
+        except BaseException:
+            del self.rooms[room]
+            raise
+        return shard
+
+    async def connect_to_user(self, room: str | int, user: str | int) -> None:
+        """Connects to a user in a room. Sending to a user connects automatically, but this lets you check it early.
+
+        Args:
+            room (str | int): Room name or ID
+            user (str | int): Username or ID
+        """
+        await self.__send_room_command(room, "connect_to_user", user)
+
+    async def send_text_packet(self, room: str | int, user: str | int, text: str) -> None:
+        """Sends a text packet to a user in a room.
+
+        Args:
+            room (str | int): Room name or ID
+            user (str | int): Username or ID
+            text (str): Text to transmit
+        """
+        await self.__send_room_command(room, "send_text_packet", user, text)
+
+    async def send_int_packet(self, room: str | int, user: str | int, packet: int) -> None:
+        """Sends an integer packet to a user in a room.
+
+        Args:
+            room (str | int): Room name or ID
+            user (str | int): Username or ID
+            packet (int): Integer to transmit
+        """
+        await self.__send_room_command(room, "send_int_packet", user, packet)
+
+    async def send_binary(self, room: str | int, user: str | int, binary: int) -> None:
+        """Sends a binary number to a user in a room.
+
+        Args:
+            room (str | int): Room name or ID
+            user (str | int): Username or ID
+            binary (int): Binary number (ex. 1010100)
+        """
+        await self.__send_room_command(room, "send_binary", user, binary)
+
+    async def ping(self, room: str | int, user: str | int) -> bool:
+        """Pings a user in a room.
+
+        Args:
+            room (str | int): Room name or ID
+            user (str | int): Username or ID
+
+        Returns:
+            bool: Received pong?
+        """
+        return await self.__send_room_command(room, "ping", user)
+
+    async def metrics(self) -> dict:
+        """Returns metrics aggregated over all the workers.
+
+        Returns:
+            dict: Totals under their names, each live worker's metrics under 'workers' and the indexes of dead workers under 'dead_workers'
+        """
+        shards = [i for i in range(self.worker_count) if i not in self.dead_shards]
+        results = await asyncio.gather(*[self.__send_command(i, "metrics") for i in shards], return_exceptions=True)
+
+        # Skip workers that died, so the rest can still be monitored
+        workers = []
+        for result in results:
+            if isinstance(result, WorkerDied): continue
+            if isinstance(result, BaseException): raise result
+            workers.append(result)
+
+        totals = {"workers": workers, "dead_workers": sorted(self.dead_shards)}
+        for worker in workers:
+            for key, value in worker.items():
+                totals[key] = totals.get(key, 0) + value
+        return totals
+
+    async def __send_room_command(self, room: str | int, method: str, *args):
+        """Sends a command to the worker the room is sharded to.
+
+        Raises:
+            KeyError: Raised if the room hasn't been added.
+        """
+        return await self.__send_command(self.rooms[room], method, room, *args)
+
+    async def __send_command(self, shard: int, method: str, *args):
+        """Sends a command to a worker and waits for the result.
+
+        Args:
+            shard (int): Worker index
+            method (str): Worker method to call
+
+        Raises:
+            WorkerDied: Raised if the worker exited before the command finished.
+
+        Returns:
+            Any: Result of the command
+        """
+        if shard in self.dead_shards:
+            raise WorkerDied(shard)
+
+        command_id = self.next_command_id
+        self.next_command_id += 1
+
+        future = self.loop.create_future()
+        self.pending[command_id] = future
+        self.pending_shards[command_id] = shard
+        self.command_queues[shard].put((command_id, method, args))
+        return await future
+
+    def __read_results(self) -> None:
+        """Resolves pending commands with results from the workers. Runs in a thread.
+        """
+        while True:
+            result = self.result_queue.get()
+            if result is None: return
+            self.loop.call_soon_threadsafe(self.__resolve, *result)
+
+    def __watch_workers(self) -> None:
+        """Waits for the worker processes to exit. Runs in a thread.
+        """
+        sentinels = {process.sentinel: i for i, process in enumerate(self.processes)}
+        while sentinels:
+            for sentinel in multiprocessing.connection.wait(list(sentinels)):
+                shard = sentinels.pop(sentinel)
+                if not self.closing:
+                    self.loop.call_soon_threadsafe(self.__fail_shard, shard)
+
+    def __fail_shard(self, shard: int) -> None:
+        """Fails the pending commands of a worker that died.
+        """
+        self.dead_shards.add(shard)
+        for command_id, command_shard in list(self.pending_shards.items()):
+            if command_shard == shard:
+                self.__resolve(command_id, True, WorkerDied(shard))
+
+    def __resolve(self, command_id: int, error: bool, value) -> None:
+        future = self.pending.pop(command_id, None)
+        self.pending_shards.pop(command_id, None)
+        if not future or future.done(): return
+
+        if error:
+            future.set_exception(value)
+        else:
+            future.set_result(value)
+
+    # asynchronous context manager enter
+    async def __aenter__(self):
+        await self.initialize()
+        return self
+
+    # asynchronous context manager exit
+    async def __aexit__(self, *args):
+        await self.close()
+
+    async def close(self) -> None:
+        """Stops the workers once they've finished their commands.
+        """
+        if not self.initialized: return
+
+        self.closing = True
+        for commands in self.command_queues:
+            commands.put(None)
+        await asyncio.to_thread(lambda: [i.join() for i in self.processes])
+
+        self.result_queue.put(None)
+        self.result_thread.join()
+        self.watch_thread.join()
+        self.initialized = False
+
+
+class _Worker:
+    def __init__(self, client: Client):
+        """Runs fleet commands in a worker process.
+
+        Args:
+            client (Client): Initialized client of the worker
+        """
+        self.client = client
+        self.rooms: Dict[str | int, RoomConnection] = {}
+        self.users: Dict[tuple, UserConnection] = {}
+
+        # Account ID of each user by the username or ID they were addressed with
+        self.account_ids: Dict[tuple, int] = {}
+
+        # Sends to the same user must not interleave
+        self.user_locks: Dict[tuple, asyncio.Lock] = {}
+
+        # Metrics
+        self.commands = 0
+        self.failures = 0
+        self.busy_time = 0.0
+
+    async def add_room(self, room: str | int) -> None:
+        self.rooms[room] = await self.client.connect_to_room(room)
+
+    async def connect_to_user(self, room: str | int, user: str | int) -> None:
+        await self.__get_user(room, user)
+
+    async def send_text_packet(self, room: str | int, user: str | int, text: str) -> None:
+        conn = await self.__get_user(room, user)
+        async with self.__lock(room, conn):
+            await conn.send_text_packet(text)
+
+    async def send_int_packet(self, room: str | int, user: str | int, packet: int) -> None:
+        conn = await self.__get_user(room, user)
+        async with self.__lock(room, conn):
+            await conn.send_int_packet(packet)
+
+    async def send_binary(self, room: str | int, user: str | int, binary: int) -> None:
+        conn = await self.__get_user(room, user)
+        async with self.__lock(room, conn):
+            await conn.send_binary(binary)
+
+    async def ping(self, room: str | int, user: str | int) -> bool:
+        conn = await self.__get_user(room, user)
+        async with self.__lock(room, conn):
+            return await conn.ping()
+
+    async def metrics(self) -> dict:
+        return {
+            "rooms": len(self.rooms),
+            "users": len(self.users),
+            "commands": self.commands,
+            "failures": self.failures,
+            "busy_time": self.busy_time,
+            "requests": self.client.request_count,
+            "throttled": self.client.throttled_count,
+        }
+
+    async def run(self, command_id: int, method: str, args: tuple, results: multiprocessing.Queue) -> None:
+        """Runs a command and reports the result to the parent process.
+        """
+        start = time.perf_counter()
+        try:
+            value = await getattr(self, method)(*args)
+            results.put((command_id, False, value))
+        except Exception as e:
+            self.failures += 1
+            results.put((command_id, True, _picklable(e)))
+        finally:
+            self.commands += 1
+            self.busy_time += time.perf_counter() - start
+
+    def __lock(self, room: str | int, conn: UserConnection) -> asyncio.Lock:
+        """Returns the lock of a user's account.
+        """
+        return self.user_locks.setdefault((room, conn.account.id), asyncio.Lock())
+
+    async def __get_user(self, room: str | int, user: str | int) -> UserConnection:
+        """Returns the connection to a user, connecting to them if needed.
+        Connections are kept per account, so a user addressed by both username and ID shares one.
+        """
+        key = (room, user.lower() if isinstance(user, str) else user)
+        if key not in self.account_ids:
+            conn = await self.rooms[room].connect_to_user(user)
+            self.users.setdefault((room, conn.account.id), conn)
+            self.account_ids[key] = conn.account.id
+        return self.users[(room, self.account_ids[key])]
+
+
+def _picklable(e: Exception) -> Exception:
+    """Returns the exception if it can be sent to the parent process, otherwise a TransmitterException describing it."""
+    try:
+        pickle.dumps(e)
+        return e
+    except Exception:
+        return TransmitterException(f"{type(e).__name__}: {e}")
+
+
+def _run_worker(client_args: tuple, commands: multiprocessing.Queue, results: multiprocessing.Queue) -> None:
+    """Entry point of a worker process."""
+    asyncio.run(_serve(client_args, commands, results))
+
+
+async def _serve(client_args: tuple, commands: multiprocessing.Queue, results: multiprocessing.Queue) -> None:
+    """Runs commands from the parent process until it sends None."""
+    loop = asyncio.get_running_loop()
+    dev_token, rr_auth, debug_mode, cache_path = client_args
+
+    client = Client(dev_token, rr_auth, debug_mode=debug_mode, cache_path=cache_path)
+    try:
+        await client.initialize()
+    except Exception as e:
+        # Fail every command instead of leaving the parent waiting
+        error = _picklable(e)
+        while (command := await loop.run_in_executor(None, commands.get)) is not None:
+            results.put((command[0], True, error))
+        return
+
+    async with client:
+        worker = _Worker(client)
+        tasks = set()
+
+        while True:
+            command = await loop.run_in_executor(None, commands.get)
+            if command is None: break
+
+            task = asyncio.create_task(worker.run(*command, results))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+
+        await asyncio.gather(*tasks)
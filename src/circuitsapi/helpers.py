@@ -1,6 +1,5 @@
 from typing import List
 from datetime import datetime
-from dateutil.parser import isoparse
 from itertools import groupby
 
 def date_to_unix(date: str, new: bool = False) -> int:
@@ -15,6 +14,7 @@ def date_to_unix(date: str, new: bool = False) -> int:
     if new:
         timestamp = datetime.strptime(date, '%m/%d/%Y %H:%M:%S %p').timestamp()
     else:
+        from dateutil.parser import isoparse
         timestamp = isoparse(date).timestamp()
         
     return int(timestamp)  # Return UNIX timestamp
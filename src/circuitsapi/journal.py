@@ -0,0 +1,78 @@
+import struct
+from dataclasses import dataclass
+from typing import Iterator
+
+# File header and record layout: timestamp, room ID, account ID, role ID, HTTP status, latency in seconds
+MAGIC = b"CAPIJRN1"
+RECORD = struct.Struct("<dqqBHf")
+
+
+@dataclass
+class JournalRecord:
+    """A role change sent by the transmitter."""
+    timestamp: float
+    room_id: int
+    account_id: int
+    role: int
+    status: int
+    latency: float
+
+
+class Journal:
+    def __init__(self, path: str, buffer_size: int = 65536):
+        """Append-only binary journal of every role change sent by the transmitter.
+
+        Args:
+            path (str): Path to the journal. Records are appended if it exists.
+            buffer_size (int, optional): Bytes buffered before writing to disk. Defaults to 65536.
+        """
+        self.path = path
+        self.file = open(path, "ab", buffering=buffer_size)
+
+        # New journal
+        if self.file.tell() == 0:
+            self.file.write(MAGIC)
+
+    def record(self, timestamp: float, room_id: int, account_id: int, role: int, status: int, latency: float) -> None:
+        """Appends a role change to the journal.
+
+        Args:
+            timestamp (float): Wall-clock time the role change was sent
+            room_id (int): Room ID
+            account_id (int): Account whose role was changed
+            role (int): Role ID
+            status (int): HTTP status of the role change
+            latency (float): Seconds the request took
+        """
+        self.file.write(RECORD.pack(timestamp, room_id, account_id, role, status, latency))
+
+    def flush(self) -> None:
+        """Writes buffered records to disk.
+        """
+        self.file.flush()
+
+    def close(self) -> None:
+        """Flushes and closes the journal.
+        """
+        self.file.close()
+
+
+def read_journal(path: str) -> Iterator[JournalRecord]:
+    """Reads the records of a journal.
+
+    Args:
+        path (str): Path to the journal
+
+    Raises:
+        ValueError: Raised if the file isn't a journal.
+
+    Returns:
+        Iterator[JournalRecord]: Records in the order they were written
+    """
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a CircuitsAPI journal.")
+
+        # Ignore a partially written record at the end
+        while len(data := f.read(RECORD.size)) == RECORD.size:
+            yield JournalRecord(*RECORD.unpack(data))
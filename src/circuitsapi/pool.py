@@ -0,0 +1,214 @@
+import asyncio
+import time
+from typing import Dict, List, Tuple
+from .client import Client, RoomConnection, UserConnection
+from .auth import TokenProvider
+from .exceptions import TransmitterException, InvalidRoomConnection
+
+
+class TransmitterPool:
+    def __init__(self, dev_token: str, accounts: List[str | TokenProvider | None], debug_mode: bool = False, cache_path: str | None = None):
+        """Pool of host accounts that share the transmission load.
+        Each account has its own client and session, so the signalling capacity grows with the amount of accounts.
+
+        Args:
+            dev_token (str): RR API token from devportal.rec.net
+            accounts (List[str | TokenProvider | None]): RR access token or token provider of each host account.
+            debug_mode (bool, optional): Debug mode. Defaults to False.
+            cache_path (str | None, optional): Path to an on-disk cache for room and account metadata. Defaults to None.
+        """
+        self.clients = [Client(dev_token, rr_auth=i, debug_mode=debug_mode, cache_path=cache_path) for i in accounts]
+
+        # Connected rooms
+        self.rooms: List[PooledRoomConnection] = []
+
+        # Initialized
+        self.initialized = False
+
+    async def initialize(self):
+        """Initializes every host account. Must be ran.
+        """
+        if self.initialized: return
+
+        await asyncio.gather(*[i.initialize() for i in self.clients])
+        for client in self.clients:
+            client.throttle_listeners.append(self.__on_throttled)
+
+        self.initialized = True
+
+    async def connect_to_room(self, room: str | int) -> "PooledRoomConnection":
+        """Create a connection to a room with every host account that has privileges in it.
+
+        Args:
+            room (str | int): Room name or ID
+
+        Returns:
+            PooledRoomConnection: PooledRoomConnection object
+        """
+        conn = PooledRoomConnection(room, self)
+        await conn.initialize()
+        self.rooms.append(conn)
+        return conn
+
+    def usage(self) -> List[dict]:
+        """Returns the quota use of each host account.
+
+        Returns:
+            List[dict]: Account ID, request count, throttled count, throttle state and connected users of each account
+        """
+        return [
+            {
+                "account_id": client.host_account_id,
+                "requests": client.request_count,
+                "throttled": client.throttled_count,
+                "is_throttled": client.is_throttled,
+                "users": sum(room.load(client) for room in self.rooms),
+            }
+            for client in self.clients
+        ]
+
+    def __on_throttled(self, client: Client) -> None:
+        """Moves users off a host account that just got rate limited.
+        """
+        for room in self.rooms:
+            room.rebalance()
+
+    # asynchronous context manager enter
+    async def __aenter__(self):
+        await self.initialize()
+        return self
+
+    # asynchronous context manager exit
+    async def __aexit__(self, *args):
+        await self.close()
+
+    async def close(self) -> None:
+        """Closes every host account's client.
+        """
+        await asyncio.gather(*[i.close() for i in self.clients])
+
+
+class PooledRoomConnection:
+    def __init__(self, room: str | int, pool: TransmitterPool):
+        """Room connection shared by the host accounts of a pool. Users are assigned to the least loaded account.
+        This class should be generated via the pool.
+
+        Args:
+            room (str | int): Room name or ID
+            pool (TransmitterPool): Pool of host accounts
+        """
+        self.room = room
+        self.pool = pool
+
+        # Room connection of each host account with privileges in the room
+        self.connections: Dict[Client, RoomConnection] = {}
+
+        # Connected users
+        self.users: List[UserConnection] = []
+
+        self.room_id = None
+        self.room_name = None
+
+    async def initialize(self):
+        """Connects each host account to the room. Must be ran.
+
+        Raises:
+            InvalidRoomConnection: Raised if none of the host accounts have privileges in the room.
+        """
+        results = await asyncio.gather(*[i.connect_to_room(self.room) for i in self.pool.clients], return_exceptions=True)
+        for client, result in zip(self.pool.clients, results):
+            # Skip accounts that can't access the room
+            if isinstance(result, TransmitterException): continue
+            if isinstance(result, BaseException): raise result
+            self.connections[client] = result
+
+        if not self.connections:
+            raise InvalidRoomConnection
+
+        # Share the roles so every account knows what the others have sent
+        first, *rest = self.connections.values()
+        for conn in rest:
+            conn.roles = first.roles
+
+        self.room_id = first.room_id
+        self.room_name = first.room_name
+
+    async def connect_to_user(self, user: str | int) -> UserConnection:
+        """Creates a connection to the specified user through the least loaded host account.
+
+        Args:
+            user (str | int): Username or ID
+
+        Returns:
+            UserConnection: Connection to the user.
+        """
+        conn = await self.__pick().connect_to_user(user)
+        conn.pool = self
+        self.users.append(conn)
+        return conn
+
+    async def connect_to_users(self, users: List[str | int]) -> Tuple[Dict[str | int, UserConnection], Dict[str | int, TransmitterException]]:
+        """Creates connections to multiple users at once and spreads them over the host accounts.
+
+        Args:
+            users (List[str | int]): Usernames or IDs
+
+        Returns:
+            Tuple[Dict[str | int, UserConnection], Dict[str | int, TransmitterException]]: Connections and failures, keyed by the given username or ID.
+        """
+        connections, failures = await self.__pick().connect_to_users(users)
+
+        # An account given by both username and ID has one connection
+        for conn in {id(i): i for i in connections.values()}.values():
+            self.__move(conn, self.__pick())
+            conn.pool = self
+            self.users.append(conn)
+        return connections, failures
+
+    def load(self, client: Client) -> int:
+        """Returns the amount of users assigned to a host account in this room.
+
+        Args:
+            client (Client): Host account's client
+
+        Returns:
+            int: Amount of users
+        """
+        return sum(1 for i in self.users if i.client is client)
+
+    def rebalance(self) -> None:
+        """Moves users off rate limited host accounts.
+        """
+        for user in self.users:
+            if not user.client.is_throttled: continue
+
+            target = self.__pick()
+            if not target.client.is_throttled:
+                self.__move(user, target)
+
+    async def wait_for_account(self, user: UserConnection) -> None:
+        """Waits until a host account isn't rate limited and moves the user to it.
+        Used when every account is rate limited, so role changes are delayed instead of lost.
+
+        Args:
+            user (UserConnection): User whose role change was rate limited
+        """
+        target = self.__pick()
+        await asyncio.sleep(max(target.client.throttled_until - time.time(), 0))
+        self.__move(user, target)
+
+    def __pick(self) -> RoomConnection:
+        """Returns the room connection of the least loaded host account that isn't rate limited.
+        If every account is rate limited, the one that recovers first is returned.
+        """
+        available = [i for i in self.connections.values() if not i.client.is_throttled]
+        if not available:
+            return min(self.connections.values(), key=lambda i: i.client.throttled_until)
+        return min(available, key=lambda i: self.load(i.client))
+
+    def __move(self, user: UserConnection, room_conn: RoomConnection) -> None:
+        """Moves a user to another host account.
+        """
+        user.room_conn = room_conn
+        user.client = room_conn.client
+        user.session = room_conn.session
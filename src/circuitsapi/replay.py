@@ -0,0 +1,80 @@
+import argparse
+import asyncio
+import inspect
+import statistics
+from typing import Awaitable, Callable, Dict, Iterable
+from .emulator import CircuitEmulator
+from .journal import JournalRecord, read_journal
+
+
+async def replay_journal(records: Iterable[JournalRecord], sink: Callable[[JournalRecord], Awaitable[None] | None], speed: float = 1.0) -> None:
+    """Feeds journal records to a sink with their original timing.
+
+    Args:
+        records (Iterable[JournalRecord]): Records to replay
+        sink (Callable[[JournalRecord], Awaitable[None] | None]): Called with each record, ex. a circuit emulator or a local stand-in server
+        speed (float, optional): Playback speed. 2 replays twice as fast, 0 replays without waiting. Defaults to 1.0.
+    """
+    previous = None
+    for record in records:
+        if speed > 0 and previous is not None:
+            await asyncio.sleep(max(record.timestamp - previous, 0) / speed)
+        previous = record.timestamp
+
+        result = sink(record)
+        if inspect.isawaitable(result):
+            await result
+
+
+def server_sink(session, base_url: str) -> Callable[[JournalRecord], Awaitable[None]]:
+    """Returns a sink that sends the role changes to a local stand-in for rooms.rec.net.
+
+    Args:
+        session (aiohttp.ClientSession): aiohttp session
+        base_url (str): URL of the stand-in server, ex. 'http://localhost:8080'
+
+    Returns:
+        Callable[[JournalRecord], Awaitable[None]]: Sink for replay_journal()
+    """
+    async def sink(record: JournalRecord) -> None:
+        async with session.put(f"{base_url}/rooms/{record.room_id}/roles/{record.account_id}", data=f"role={record.role}"):
+            pass
+
+    return sink
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replays a CircuitsAPI journal into the circuit emulator.")
+    parser.add_argument("path", help="path to the journal")
+    parser.add_argument("--speed", type=float, default=0, help="playback speed, 0 replays without waiting (default: 0)")
+    parser.add_argument("--text", action="store_true", help="decode payloads as text")
+    args = parser.parse_args()
+
+    records = list(read_journal(args.path))
+
+    # Each room has its own circuits, so partial packets of different rooms don't mix
+    emulators: Dict[int, CircuitEmulator] = {}
+
+    def sink(record: JournalRecord) -> None:
+        # Only successful role changes reach the game
+        if record.status != 200: return
+
+        emulator = emulators.setdefault(record.room_id, CircuitEmulator())
+        payload = emulator.feed(record.account_id, record.role)
+        if payload is not None:
+            decoded = emulator.decode_text(payload) if args.text else payload
+            print(f"{record.timestamp:.3f} room {record.room_id} user {record.account_id}: {decoded}")
+
+    asyncio.run(replay_journal(records, sink, args.speed))
+
+    # Summary
+    if records:
+        latencies = sorted(i.latency for i in records)
+        failures = sum(1 for i in records if i.status != 200)
+        duration = records[-1].timestamp - records[0].timestamp
+        print(f"\n{len(records)} role changes over {duration:.1f}s, {failures} failed")
+        print(f"Latency: mean {statistics.mean(latencies) * 1000:.1f} ms, p95 {latencies[int(len(latencies) * 0.95)] * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
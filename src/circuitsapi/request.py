@@ -2,7 +2,7 @@ import aiohttp
 from aiohttp.client_exceptions import ServerDisconnectedError
 
 class Request:
-    def __init__(self, session: aiohttp.ClientSession, method: str, url: str, payload: str | dict = {}):
+    def __init__(self, session: aiohttp.ClientSession, method: str, url: str, payload: str | dict = {}, headers: dict | None = None):
         # aiohttp session
         self.session = session
 
@@ -10,6 +10,7 @@ class Request:
         self.method = method
         self.url = url
         self.payload = payload
+        self.headers = headers
 
         # Attempts if failed
         self.attempts = 0
@@ -27,7 +28,7 @@ class Request:
             InvalidMethod: If method argument is not supported
         """
         try:
-            resp = await self.session.request(method=self.method, url=self.url, data=self.payload)
+            resp = await self.session.request(method=self.method, url=self.url, data=self.payload, headers=self.headers)
             return resp
         except ServerDisconnectedError:
             if self.attempts >= self.max_attempts:
@@ -0,0 +1,133 @@
+import asyncio
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List
+from .emulator import CircuitEmulator
+from .exceptions import UserNotInRoom
+
+if TYPE_CHECKING:
+    from .client import UserConnection
+
+
+class Uplink:
+    def __init__(
+        self,
+        user: "UserConnection",
+        symbols: Dict[Any, str] | None = None,
+        source: Callable[[], Awaitable[Any]] | None = None,
+        min_interval: float = 0.25,
+        max_interval: float = 2.0,
+        backoff: float = 1.5
+    ):
+        """Receive channel from the game back to Python, built on state the game can change and the API can poll.
+        Defaults to the matchmaking policy of the connected user's instance.
+
+        Polling starts at min_interval and backs off up to max_interval while nothing changes.
+        It speeds up again when a change is seen or when data is transmitted to the user,
+        so the game should hold its first signal longer than max_interval and the rest longer than min_interval.
+
+        Without symbols, every change of the state is received as the new state, ex. an acknowledgement.
+        With symbols, states are decoded like the 'Receiver' circuit board: bits, repeats and ends of packets.
+        The first packet is the packet count, followed by the packets.
+
+        Args:
+            user (UserConnection): Connected user
+            symbols (Dict[Any, str] | None, optional): Signal of each state: '0', '1', 'repeat' or 'end'. Defaults to None.
+            source (Callable[[], Awaitable[Any]] | None, optional): Returns the current state. Defaults to the matchmaking policy.
+            min_interval (float, optional): Shortest time between polls in seconds. Defaults to 0.25.
+            max_interval (float, optional): Longest time between polls in seconds. Defaults to 2.0.
+            backoff (float, optional): Multiplier applied to the interval after each poll without changes. Defaults to 1.5.
+        """
+        self.user = user
+        self.symbols = symbols
+        self.source = source or self.__get_matchmaking_policy
+
+        # Polling schedule
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.interval = min_interval
+
+        # Latest known state
+        self.state = None
+        self.has_state = False
+
+        # Decodes signals into payloads
+        self.emulator = CircuitEmulator()
+
+        # Stats
+        self.polls = 0
+        self.changes = 0
+
+    async def receive(self, timeout: float | None = None) -> List[int] | Any:
+        """Waits for the next message from the game.
+
+        Args:
+            timeout (float | None, optional): Seconds to wait. Defaults to None.
+
+        Raises:
+            asyncio.TimeoutError: Raised if nothing was received in time.
+            UserNotInRoom: Raised if the user left the room.
+
+        Returns:
+            List[int] | Any: Packets of a payload if symbols are set, otherwise the new state
+        """
+        return await asyncio.wait_for(self.__receive(), timeout)
+
+    def wake(self) -> None:
+        """Polls at the shortest interval again. Called when data is transmitted, since the game may respond.
+        """
+        self.interval = self.min_interval
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> List[int] | Any:
+        return await self.receive()
+
+    async def __receive(self) -> List[int] | Any:
+        """Polls until a change completes a message.
+        """
+        signal_roles = {"1": 10, "0": 20, "repeat": 25, "end": 0}
+
+        # The first poll sets the baseline
+        if not self.has_state:
+            self.state = await self.__poll()
+            self.has_state = True
+
+        while True:
+            await asyncio.sleep(self.interval)
+            state = await self.__poll()
+
+            # Nothing changed, back off
+            if state == self.state:
+                self.interval = min(self.interval * self.backoff, self.max_interval)
+                continue
+
+            self.state = state
+            self.changes += 1
+            self.interval = self.min_interval
+
+            if self.symbols is None:
+                return state
+
+            signal = self.symbols.get(state)
+            if signal is None: continue
+
+            payload = self.emulator.feed(self.user.account.id, signal_roles[signal])
+            if payload is not None:
+                return payload
+
+    async def __poll(self) -> Any:
+        self.polls += 1
+        return await self.source()
+
+    async def __get_matchmaking_policy(self) -> Any:
+        """Returns the matchmaking policy of the user's instance
+
+        Raises:
+            UserNotInRoom: Raised if the user is not in the connected room.
+        """
+        instance = await self.user.get_instance()
+        if instance == None or instance.get("roomId") != self.user.room_id:
+            raise UserNotInRoom
+
+        return instance.get("matchmakingPolicy")